@@ -48,13 +48,18 @@ from .const import (
     DATA_SDM,
     DATA_SUBSCRIBER,
     DOMAIN,
+    EVENT_MEDIA_CACHE_SIZE,
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
     OOB_REDIRECT_URI,
 )
 from .events import EVENT_NAME_MAP, NEST_EVENT
 from .legacy import async_setup_legacy, async_setup_legacy_entry
-from .media_source import async_get_media_event_store, get_media_source_devices
+from .media_source import (
+    NestEventMediaStore,
+    async_get_media_event_store,
+    get_media_source_devices,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -90,12 +95,6 @@ PLATFORMS = [Platform.SENSOR, Platform.CAMERA, Platform.CLIMATE]
 WEB_AUTH_DOMAIN = DOMAIN
 INSTALLED_AUTH_DOMAIN = f"{DOMAIN}.installed"
 
-# Fetch media events with a disk backed cache, with a limit for each camera
-# device. The largest media items are mp4 clips at ~120kb each, and we target
-# ~125MB of storage per camera to try to balance a reasonable user experience
-# for event history not not filling the disk.
-EVENT_MEDIA_CACHE_SIZE = 1024  # number of events
-
 
 class WebAuth(config_entry_oauth2_flow.LocalOAuth2Implementation):
     """OAuth implementation using OAuth for web applications."""
@@ -226,8 +225,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Keep media for last N events in memory
     subscriber.cache_policy.event_cache_size = EVENT_MEDIA_CACHE_SIZE
     subscriber.cache_policy.fetch = True
-    # Use disk backed event media store
-    subscriber.cache_policy.store = await async_get_media_event_store(hass, subscriber)
+    # Use disk backed event media store. Disposed again on every setup
+    # failure path below so a ConfigEntryNotReady retry loop does not leak
+    # the store's executor threads and bus listeners.
+    media_store = await async_get_media_event_store(hass, subscriber)
+    subscriber.cache_policy.store = media_store
 
     async def async_config_reload() -> None:
         await hass.config_entries.async_reload(entry.entry_id)
@@ -238,16 +240,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await subscriber.start_async()
     except AuthException as err:
         _LOGGER.debug("Subscriber authentication error: %s", err)
+        await media_store.async_close()
         raise ConfigEntryAuthFailed from err
     except ConfigurationException as err:
         _LOGGER.error("Configuration error: %s", err)
         subscriber.stop_async()
+        await media_store.async_close()
         return False
     except SubscriberException as err:
         if DATA_NEST_UNAVAILABLE not in hass.data[DOMAIN]:
             _LOGGER.error("Subscriber error: %s", err)
             hass.data[DOMAIN][DATA_NEST_UNAVAILABLE] = True
         subscriber.stop_async()
+        await media_store.async_close()
         raise ConfigEntryNotReady from err
 
     try:
@@ -257,6 +262,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Device manager error: %s", err)
             hass.data[DOMAIN][DATA_NEST_UNAVAILABLE] = True
         subscriber.stop_async()
+        await media_store.async_close()
         raise ConfigEntryNotReady from err
 
     hass.data[DOMAIN].pop(DATA_NEST_UNAVAILABLE, None)
@@ -275,6 +281,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Stopping nest subscriber")
     subscriber = hass.data[DOMAIN][DATA_SUBSCRIBER]
     subscriber.stop_async()
+    # Dispose the disk backed media store so a reload does not leak its
+    # listeners or caches
+    if isinstance(subscriber.cache_policy.store, NestEventMediaStore):
+        await subscriber.cache_policy.store.async_close()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(DATA_SUBSCRIBER)
@@ -347,6 +357,9 @@ class NestEventMediaView(HomeAssistantView):
             return self._json_error(
                 f"No event found for event_id '{event_token}'", HTTPStatus.NOT_FOUND
             )
+        # Media is served from bytes rather than a FileResponse/sendfile since
+        # the mapping of event token to on-disk media is internal to the
+        # subscriber library and only exposed as contents.
         return web.Response(body=media.contents, content_type=media.content_type)
 
     def _json_error(self, message: str, status: HTTPStatus) -> web.StreamResponse:
@@ -11,6 +11,12 @@ CONF_CLOUD_PROJECT_ID = "cloud_project_id"
 
 SIGNAL_NEST_UPDATE = "nest_update"
 
+# Fetch media events with a disk backed cache, with a limit for each camera
+# device. The largest media items are mp4 clips at ~120kb each, and we target
+# ~125MB of storage per camera to try to balance a reasonable user experience
+# for event history not not filling the disk.
+EVENT_MEDIA_CACHE_SIZE = 1024  # number of events
+
 # For the Google Nest Device Access API
 OAUTH2_AUTHORIZE = (
     "https://nestservices.google.com/partnerconnections/{project_id}/auth"
@@ -18,8 +18,14 @@ https://developers.google.com/nest/device-access/api/camera#handle_camera_events
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from functools import lru_cache
+import heapq
 import logging
 import os
 
@@ -31,6 +37,7 @@ from google_nest_sdm.event_media import (
     EventMediaStore,
     ImageSession,
 )
+from google_nest_sdm.exceptions import DecodeException, GoogleNestException
 from google_nest_sdm.google_nest_subscriber import GoogleNestSubscriber
 
 from homeassistant.components.media_player.const import (
@@ -48,13 +55,14 @@ from homeassistant.components.media_source.models import (
     MediaSourceItem,
     PlayMedia,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import DATE_STR_FORMAT
 from homeassistant.util import dt as dt_util
 
-from .const import DATA_SUBSCRIBER, DOMAIN
+from .const import DATA_SUBSCRIBER, DOMAIN, EVENT_MEDIA_CACHE_SIZE
 from .device_info import NestDeviceInfo
 from .events import EVENT_NAME_MAP, MEDIA_SOURCE_EVENT_TITLE_MAP
 
@@ -74,11 +82,42 @@ MEDIA_PATH = f"{DOMAIN}/event_media"
 
 # Size of small in-memory disk cache to avoid excessive disk reads
 DISK_READ_LRU_MAX_SIZE = 32
+# Cap on events returned per device, derived from the subscriber's event
+# cache size so every cached event stays browsable while the most-recent-first
+# ordering keeps its O(n log k) bound
+MAX_BROWSE_CHILDREN = EVENT_MEDIA_CACHE_SIZE
+# Number of most recent events warmed into the media cache after a browse,
+# since the user typically opens one of the first events shown
+PREFETCH_MEDIA_COUNT = 4
+
+# Formatted event titles are cached since browsing rebuilds the full list of
+# children for a device on every request
+EVENT_TITLE_CACHE_SIZE = 1024
+MEDIA_KEY_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=EVENT_TITLE_CACHE_SIZE)
+def _format_event_title(event_name: str, timestamp: datetime, tz: tzinfo) -> str:
+    """Return the media browser title for an event.
+
+    The local timezone is part of the cache key so entries are not reused
+    across a timezone change.
+    """
+    return CLIP_TITLE_FORMAT.format(
+        event_name=event_name,
+        event_time=dt_util.as_local(timestamp).strftime(DATE_STR_FORMAT),
+    )
+
+
+@lru_cache(maxsize=MEDIA_KEY_CACHE_SIZE)
+def _media_key(device_id_str: str, epoch: int, event_type_str: str, suffix: str) -> str:
+    """Return the media key for an event, cached since the subscriber asks repeatedly."""
+    return f"{device_id_str}/{epoch}-{event_type_str}.{suffix}"
 
 
 async def async_get_media_event_store(
     hass: HomeAssistant, subscriber: GoogleNestSubscriber
-) -> EventMediaStore:
+) -> NestEventMediaStore:
     """Create the disk backed EventMediaStore."""
     media_path = hass.config.path(MEDIA_PATH)
 
@@ -90,6 +129,18 @@ async def async_get_media_event_store(
     return NestEventMediaStore(hass, subscriber, store, media_path)
 
 
+def _is_nest_registry_event(hass: HomeAssistant, event: Event) -> bool:
+    """Return True if a device registry event concerns a nest device.
+
+    A removed device no longer resolves in the registry, so removal events
+    pass the filter rather than risk keeping a stale cache entry.
+    """
+    device_registry = dr.async_get(hass)
+    if (device := device_registry.async_get(event.data["device_id"])) is None:
+        return True
+    return any(ident[0] == DOMAIN for ident in device.identifiers)
+
+
 class NestEventMediaStore(EventMediaStore):
     """Storage hook to locally persist nest media for events.
 
@@ -118,12 +169,51 @@ class NestEventMediaStore(EventMediaStore):
         self._store = store
         self._media_path = media_path
         self._data: dict | None = None
-        self._devices: Mapping[str, str] | None = {}
+        self._devices: Mapping[str, str] | None = None
+        # Memoized media path prefix for each nest device id
+        self._device_id_str_cache: dict[str, str] = {}
+        # Small LRU of media contents, keyed by media key, to avoid repeat
+        # disk reads while the user browses recent events.
+        self._media_cache: OrderedDict[str, bytes] = OrderedDict()
+        # Pending media writes, keyed by media key, coalesced and flushed to
+        # disk in batches by a background task.
+        self._pending_writes: dict[str, bytes] = {}
+        # Target directory for each media key, populated when the key is
+        # generated so the write path need not re-derive the dirname
+        self._dir_for_key: dict[str, str] = {}
+        # Device directories known to exist, to skip repeated makedirs stats
+        self._ensured_dirs: set[str] = set()
+        self._flush_task: asyncio.Task | None = None
+        # Dedicated pool for media disk i/o, keeping potentially slow reads
+        # and writes of large clips out of the shared default executor.
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="nest_media"
+        )
+        self._unsub_registry: CALLBACK_TYPE | None = self._hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            event_filter=self._async_registry_event_filter,
+        )
+        self._unsub_stop: CALLBACK_TYPE | None = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    @callback
+    def _async_registry_event_filter(self, event: Event) -> bool:
+        """Pass only registry events for nest devices to the listener."""
+        return _is_nest_registry_event(self._hass, event)
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Invalidate the device mapping cache when the registry changes."""
+        self._devices = None
+        self._device_id_str_cache.clear()
 
     async def async_load(self) -> dict | None:
         """Load data."""
-        if self._data is None:
+        if self._devices is None:
             self._devices = await self._get_devices()
+        if self._data is None:
             data = await self._store.async_load()
             if data is None:
                 _LOGGER.debug("Loaded empty event store")
@@ -141,12 +231,19 @@ class NestEventMediaStore(EventMediaStore):
 
     async def async_save(self, data: dict) -> None:
         """Save data."""
-        self._data = data
+        if data is not self._data:
+            self._data = data
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY_SECONDS)
 
-        def provide_data() -> dict:
-            return data
+    def _data_to_save(self) -> dict:
+        """Return data to save, invoked by the Store when flushing to disk.
 
-        self._store.async_delay_save(provide_data, STORAGE_SAVE_DELAY_SECONDS)
+        Only the actual flush pays for a snapshot copy; the Store then
+        serializes and writes it in the executor, keeping the json encode of
+        the potentially large event map off the event loop.
+        """
+        assert self._data is not None
+        return dict(self._data)
 
     def get_media_key(self, device_id: str, event: ImageEventBase) -> str:
         """Return the filename to use for a new event."""
@@ -155,25 +252,40 @@ class NestEventMediaStore(EventMediaStore):
         return self.get_image_media_key(device_id, event)
 
     def _map_device_id(self, device_id: str) -> str:
-        return (
-            self._devices.get(device_id, f"{device_id}-unknown_device")
-            if self._devices
-            else "unknown_device"
-        )
+        if (device_id_str := self._device_id_str_cache.get(device_id)) is None:
+            if not self._devices:
+                # The mapping has not loaded yet; don't memoize the fallback
+                # or the real prefix would never be picked up
+                return "unknown_device"
+            device_id_str = self._devices.get(
+                device_id, f"{device_id}-unknown_device"
+            )
+            self._device_id_str_cache[device_id] = device_id_str
+        return device_id_str
 
     def get_image_media_key(self, device_id: str, event: ImageEventBase) -> str:
         """Return the filename for image media for an event."""
         device_id_str = self._map_device_id(device_id)
-        time_str = str(int(event.timestamp.timestamp()))
-        event_type_str = EVENT_NAME_MAP.get(event.event_type, "event")
-        return f"{device_id_str}/{time_str}-{event_type_str}.jpg"
+        media_key = _media_key(
+            device_id_str,
+            int(event.timestamp.timestamp()),
+            EVENT_NAME_MAP.get(event.event_type, "event"),
+            "jpg",
+        )
+        self._dir_for_key.setdefault(media_key, f"{self._media_path}/{device_id_str}")
+        return media_key
 
     def get_clip_preview_media_key(self, device_id: str, event: ImageEventBase) -> str:
         """Return the filename for clip preview media for an event session."""
         device_id_str = self._map_device_id(device_id)
-        time_str = str(int(event.timestamp.timestamp()))
-        event_type_str = EVENT_NAME_MAP.get(event.event_type, "event")
-        return f"{device_id_str}/{time_str}-{event_type_str}.mp4"
+        media_key = _media_key(
+            device_id_str,
+            int(event.timestamp.timestamp()),
+            EVENT_NAME_MAP.get(event.event_type, "event"),
+            "mp4",
+        )
+        self._dir_for_key.setdefault(media_key, f"{self._media_path}/{device_id_str}")
+        return media_key
 
     def get_media_filename(self, media_key: str) -> str:
         """Return the filename in storage for a media key."""
@@ -181,6 +293,11 @@ class NestEventMediaStore(EventMediaStore):
 
     async def async_load_media(self, media_key: str) -> bytes | None:
         """Load media content."""
+        if (content := self._media_cache.get(media_key)) is not None:
+            self._media_cache.move_to_end(media_key)
+            return content
+        if (content := self._pending_writes.get(media_key)) is not None:
+            return content
         filename = self.get_media_filename(media_key)
 
         def load_media(filename: str) -> bytes | None:
@@ -191,43 +308,137 @@ class NestEventMediaStore(EventMediaStore):
                 return media.read()
 
         try:
-            return await self._hass.async_add_executor_job(load_media, filename)
+            content = await self._hass.loop.run_in_executor(
+                self._io_executor, load_media, filename
+            )
         except OSError as err:
             _LOGGER.error("Unable to read media file: %s %s", filename, err)
             return None
+        if content is not None:
+            self._media_cache[media_key] = content
+            while len(self._media_cache) > DISK_READ_LRU_MAX_SIZE:
+                self._media_cache.popitem(last=False)
+        return content
 
     async def async_save_media(self, media_key: str, content: bytes) -> None:
-        """Write media content."""
-        filename = self.get_media_filename(media_key)
-
-        def save_media(filename: str, content: bytes) -> None:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            if os.path.exists(filename):
-                _LOGGER.debug(
-                    "Event media already exists, not overwriting: %s", filename
-                )
-                return
-            _LOGGER.debug("Saving event media to disk store: %s", filename)
-            with open(filename, "wb") as media:
-                media.write(content)
-
+        """Write media content, coalescing bursts into batched disk writes."""
+        self._media_cache.pop(media_key, None)
+        self._pending_writes[media_key] = content
+        if self._flush_task is None:
+            self._flush_task = self._hass.async_create_task(self._async_flush_media())
+
+    async def _async_flush_media(self) -> None:
+        """Flush pending media writes to disk until the queue is drained."""
         try:
-            await self._hass.async_add_executor_job(save_media, filename, content)
-        except OSError as err:
-            _LOGGER.error("Unable to write media file: %s %s", filename, err)
+            while self._pending_writes:
+                batch = list(self._pending_writes.items())
+                await self._hass.loop.run_in_executor(
+                    self._io_executor, self._save_media_batch, batch
+                )
+                for media_key, _ in batch:
+                    self._pending_writes.pop(media_key, None)
+        finally:
+            # Always clear the task so later saves can schedule a new flush,
+            # even if the executor rejected the batch (e.g. shutdown race)
+            self._flush_task = None
+            if self._pending_writes:
+                _LOGGER.error(
+                    "Dropping %d pending media writes after flush failure",
+                    len(self._pending_writes),
+                )
+                self._pending_writes.clear()
+
+    def _save_media_batch(self, batch: list[tuple[str, bytes]]) -> None:
+        """Write a batch of media files to disk, invoked in the executor."""
+        for media_key, content in batch:
+            filename = self.get_media_filename(media_key)
+            dirname = self._dir_for_key.get(media_key) or os.path.dirname(filename)
+            try:
+                if dirname not in self._ensured_dirs:
+                    os.makedirs(dirname, exist_ok=True)
+                    self._ensured_dirs.add(dirname)
+                try:
+                    media = open(filename, "xb")
+                except FileExistsError:
+                    _LOGGER.debug(
+                        "Event media already exists, not overwriting: %s", filename
+                    )
+                    continue
+                except FileNotFoundError:
+                    # The directory was removed out from under the memo,
+                    # e.g. during teardown; drop the write rather than
+                    # resurrect a directory that was deliberately deleted
+                    self._ensured_dirs.discard(dirname)
+                    _LOGGER.debug(
+                        "Media directory removed, dropping write: %s", filename
+                    )
+                    continue
+                _LOGGER.debug("Saving event media to disk store: %s", filename)
+                with media:
+                    media.write(content)
+            except OSError as err:
+                _LOGGER.error("Unable to write media file: %s %s", filename, err)
+
+    async def async_close(self) -> None:
+        """Release the store's listeners, caches and executor.
+
+        Called when the config entry is unloaded so a reload does not leak
+        bus listeners, the i/o worker threads or the cached media blobs of
+        the stale store. Safe to call more than once (e.g. unload after
+        shutdown).
+        """
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._flush_task is not None:
+            try:
+                await self._flush_task
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error flushing event media on close")
+        await self._hass.async_add_executor_job(self._io_executor.shutdown)
+        self._media_cache.clear()
+        self._pending_writes.clear()
+
+    async def _async_handle_stop(self, event: Event) -> None:
+        """Release resources at shutdown without writing further media.
+
+        Writes still waiting in the queue are dropped rather than flushed:
+        teardown may already have removed the media directory, and a late
+        write would recreate it.
+        """
+        if self._pending_writes:
+            _LOGGER.debug(
+                "Dropping %d unflushed media writes at shutdown",
+                len(self._pending_writes),
+            )
+            self._pending_writes.clear()
+        # The once listener has already removed itself at this point
+        self._unsub_stop = None
+        await self.async_close()
 
     async def async_remove_media(self, media_key: str) -> None:
         """Remove media content."""
+        self._media_cache.pop(media_key, None)
         filename = self.get_media_filename(media_key)
+        # Drop any write still waiting in the flush queue so a removal that
+        # races a pending save can't resurrect the file on disk.
+        self._pending_writes.pop(media_key, None)
+        self._dir_for_key.pop(media_key, None)
 
         def remove_media(filename: str) -> None:
-            if not os.path.exists(filename):
-                return None
             _LOGGER.debug("Removing event media from disk store: %s", filename)
-            os.remove(filename)
+            try:
+                os.unlink(filename)
+            except FileNotFoundError:
+                pass
 
         try:
-            await self._hass.async_add_executor_job(remove_media, filename)
+            await self._hass.loop.run_in_executor(
+                self._io_executor, remove_media, filename
+            )
         except OSError as err:
             _LOGGER.error("Unable to remove media file: %s %s", filename, err)
 
@@ -292,10 +503,10 @@ def parse_media_id(identifier: str | None = None) -> MediaId | None:
     """Parse the identifier path string into a MediaId."""
     if identifier is None or identifier == "":
         return None
-    parts = identifier.split("/")
-    if len(parts) > 1:
-        return MediaId(parts[0], parts[1])
-    return MediaId(parts[0])
+    device_id, sep, event_token = identifier.partition("/")
+    if sep:
+        return MediaId(device_id, event_token)
+    return MediaId(device_id)
 
 
 class NestMediaSource(MediaSource):
@@ -315,6 +526,25 @@ class NestMediaSource(MediaSource):
         """Initialize NestMediaSource."""
         super().__init__(DOMAIN)
         self.hass = hass
+        self._device_cache: Mapping[str, Device] | None = None
+        self._cache_subscriber: GoogleNestSubscriber | None = None
+        self._root_cache: BrowseMediaSource | None = None
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            event_filter=self._async_registry_event_filter,
+        )
+
+    @callback
+    def _async_registry_event_filter(self, event: Event) -> bool:
+        """Pass only registry events for nest devices to the listener."""
+        return _is_nest_registry_event(self.hass, event)
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Invalidate the cached device list when the registry changes."""
+        self._device_cache = None
+        self._root_cache = None
 
     async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
         """Resolve media identifier to a url."""
@@ -354,14 +584,16 @@ class NestMediaSource(MediaSource):
         )
         devices = await self.devices()
         if media_id is None:
-            # Browse the root and return child devices
-            browse_root = _browse_root()
-            browse_root.children = []
-            for device_id, child_device in devices.items():
-                browse_root.children.append(
+            # Browse the root and return child devices, rebuilding the tree
+            # only when the device cache has been invalidated
+            if self._root_cache is None:
+                browse_root = _browse_root()
+                browse_root.children = [
                     _browse_device(MediaId(device_id), child_device)
-                )
-            return browse_root
+                    for device_id, child_device in devices.items()
+                ]
+                self._root_cache = browse_root
+            return self._root_cache
 
         # Browse either a device or events within a device
         if not (device := devices.get(media_id.device_id)):
@@ -377,12 +609,19 @@ class NestMediaSource(MediaSource):
             if media_id.event_token is None:
                 # Browse a specific device and return child events
                 browse_device = _browse_device(media_id, device)
-                browse_device.children = []
-                for clip in clips.values():
-                    event_id = MediaId(media_id.device_id, clip.event_token)
-                    browse_device.children.append(
-                        _browse_clip_preview(event_id, device, clip)
+                # Most recent first, bounded so huge histories stay cheap
+                recent_clips = heapq.nlargest(
+                    MAX_BROWSE_CHILDREN, clips.values(), key=lambda x: x.timestamp
+                )
+                browse_device.children = [
+                    _browse_clip_preview(
+                        MediaId(media_id.device_id, clip.event_token), device, clip
                     )
+                    for clip in recent_clips
+                ]
+                self._async_prefetch_media(
+                    device, [clip.event_token for clip in recent_clips]
+                )
                 return browse_device
 
             # Browse a specific event
@@ -397,12 +636,19 @@ class NestMediaSource(MediaSource):
         if media_id.event_token is None:
             # Browse a specific device and return child events
             browse_device = _browse_device(media_id, device)
-            browse_device.children = []
-            for image in images.values():
-                event_id = MediaId(media_id.device_id, image.event_token)
-                browse_device.children.append(
-                    _browse_image_event(event_id, device, image)
+            # Most recent first, bounded so huge histories stay cheap
+            recent_images = heapq.nlargest(
+                MAX_BROWSE_CHILDREN, images.values(), key=lambda x: x.timestamp
+            )
+            browse_device.children = [
+                _browse_image_event(
+                    MediaId(media_id.device_id, image.event_token), device, image
                 )
+                for image in recent_images
+            ]
+            self._async_prefetch_media(
+                device, [image.event_token for image in recent_images]
+            )
             return browse_device
 
         # Browse a specific event
@@ -412,9 +658,34 @@ class NestMediaSource(MediaSource):
             )
         return _browse_image_event(media_id, device, single_image)
 
+    @callback
+    def _async_prefetch_media(self, device: Device, event_tokens: list[str]) -> None:
+        """Warm the media cache for the events the user is likely to open next.
+
+        The browse response lists events most recent first, so fetching the
+        head of the list in the background populates the store's read cache
+        before the user clicks.
+        """
+
+        async def prefetch() -> None:
+            for event_token in event_tokens[:PREFETCH_MEDIA_COUNT]:
+                try:
+                    await device.event_media_manager.get_media_from_token(event_token)
+                except (GoogleNestException, DecodeException) as err:
+                    _LOGGER.debug("Error prefetching event media: %s", err)
+                    return
+
+        if event_tokens:
+            self.hass.async_create_task(prefetch())
+
     async def devices(self) -> Mapping[str, Device]:
         """Return all event media related devices."""
-        return await get_media_source_devices(self.hass)
+        subscriber = self.hass.data[DOMAIN].get(DATA_SUBSCRIBER)
+        if self._device_cache is None or self._cache_subscriber is not subscriber:
+            self._device_cache = await get_media_source_devices(self.hass)
+            self._cache_subscriber = subscriber
+            self._root_cache = None
+        return self._device_cache
 
 
 async def _async_get_clip_preview_sessions(
@@ -476,9 +747,8 @@ def _browse_clip_preview(
         identifier=event_id.identifier,
         media_class=MEDIA_CLASS_IMAGE,
         media_content_type=MEDIA_TYPE_IMAGE,
-        title=CLIP_TITLE_FORMAT.format(
-            event_name=", ".join(types),
-            event_time=dt_util.as_local(event.timestamp).strftime(DATE_STR_FORMAT),
+        title=_format_event_title(
+            ", ".join(types), event.timestamp, dt_util.DEFAULT_TIME_ZONE
         ),
         can_play=True,
         can_expand=False,
@@ -496,9 +766,10 @@ def _browse_image_event(
         identifier=event_id.identifier,
         media_class=MEDIA_CLASS_IMAGE,
         media_content_type=MEDIA_TYPE_IMAGE,
-        title=CLIP_TITLE_FORMAT.format(
-            event_name=MEDIA_SOURCE_EVENT_TITLE_MAP.get(event.event_type, "Event"),
-            event_time=dt_util.as_local(event.timestamp).strftime(DATE_STR_FORMAT),
+        title=_format_event_title(
+            MEDIA_SOURCE_EVENT_TITLE_MAP.get(event.event_type, "Event"),
+            event.timestamp,
+            dt_util.DEFAULT_TIME_ZONE,
         ),
         can_play=False,
         can_expand=False,
@@ -1,8 +1,10 @@
 """Test the homewizard config flow."""
+import dataclasses
 import logging
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aiohwenergy import DisabledError
+import pytest
 
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
@@ -14,6 +16,54 @@ from .generator import get_mock_device
 
 _LOGGER = logging.getLogger(__name__)
 
+# Discovery parameters of a healthy device; the discovery-failure tests build
+# their variants from these with dataclasses.replace instead of re-declaring
+# the full service info inline.
+BASE_PROPS = {
+    "api_enabled": "1",
+    "path": "/api/v1",
+    "product_name": "P1 meter",
+    "product_type": "HWE-P1",
+    "serial": "aabbccddeeff",
+}
+BASE_SERVICE_INFO = zeroconf.ZeroconfServiceInfo(
+    host="192.168.43.183",
+    port=80,
+    hostname="p1meter-ddeeff.local.",
+    type="",
+    name="",
+    properties=BASE_PROPS,
+)
+
+
+@pytest.fixture(scope="module")
+def shared_mock_device():
+    """Return one mock device for the tests that only read its attributes.
+
+    The discovery tests never mutate the mock nor assert on its call counts,
+    so they can share a single instance instead of building a fresh
+    AsyncMock tree per test.
+    """
+    return get_mock_device()
+
+
+@pytest.fixture(autouse=True)
+def _mock_homewizard(monkeypatch, shared_mock_device):
+    """Point the api client at the shared device and stub entry setup.
+
+    Installing the patches once per test with monkeypatch replaces the
+    with-patch blocks previously repeated in every test; entry setup itself
+    is exercised in test_init.py. Tests that need a custom device re-patch
+    aiohwenergy.HomeWizardEnergy locally.
+    """
+    monkeypatch.setattr(
+        "aiohwenergy.HomeWizardEnergy", lambda *args, **kwargs: shared_mock_device
+    )
+    monkeypatch.setattr(
+        "homeassistant.components.homewizard.async_setup_entry",
+        AsyncMock(return_value=True),
+    )
+
 
 async def test_manual_flow_works(hass, aioclient_mock):
     """Test config flow accepts user configuration."""
@@ -40,55 +90,32 @@ async def test_manual_flow_works(hass, aioclient_mock):
     assert result["title"] == f"{device.device.product_name} (aabbccddeeff)"
     assert result["data"][CONF_IP_ADDRESS] == "2.2.2.2"
 
-    with patch(
-        "aiohwenergy.HomeWizardEnergy",
-        return_value=device,
-    ):
-        entries = hass.config_entries.async_entries(DOMAIN)
+    entries = hass.config_entries.async_entries(DOMAIN)
 
     assert len(entries) == 1
     entry = entries[0]
     assert entry.unique_id == f"{device.device.product_type}_{device.device.serial}"
 
-    assert len(device.initialize.mock_calls) == 2
+    # Only the config flow itself touches the device now; entry setup is
+    # stubbed out by _mock_homewizard and covered in test_init.py.
+    assert len(device.initialize.mock_calls) == 1
     assert len(device.close.mock_calls) == 1
 
 
 async def test_discovery_flow_works(hass, aioclient_mock):
     """Test discovery setup flow works."""
 
-    service_info = zeroconf.ZeroconfServiceInfo(
-        host="192.168.43.183",
-        port=80,
-        hostname="p1meter-ddeeff.local.",
-        type="",
-        name="",
-        properties={
-            "api_enabled": "1",
-            "path": "/api/v1",
-            "product_name": "P1 meter",
-            "product_type": "HWE-P1",
-            "serial": "aabbccddeeff",
-        },
-    )
+    service_info = BASE_SERVICE_INFO
 
-    with patch("aiohwenergy.HomeWizardEnergy", return_value=get_mock_device()), patch(
-        "homeassistant.components.homewizard.async_setup_entry",
-        return_value=True,
-    ):
-        flow = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_ZEROCONF},
-            data=service_info,
-        )
+    flow = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_ZEROCONF},
+        data=service_info,
+    )
 
-    with patch(
-        "homeassistant.components.homewizard.async_setup_entry",
-        return_value=True,
-    ):
-        result = await hass.config_entries.flow.async_configure(
-            flow["flow_id"], user_input={}
-        )
+    result = await hass.config_entries.flow.async_configure(
+        flow["flow_id"], user_input={}
+    )
 
     assert result["type"] == RESULT_TYPE_CREATE_ENTRY
     assert result["title"] == "P1 meter (aabbccddeeff)"
@@ -98,110 +125,38 @@ async def test_discovery_flow_works(hass, aioclient_mock):
     assert result["result"].unique_id == "HWE-P1_aabbccddeeff"
 
 
-async def test_discovery_disabled_api(hass, aioclient_mock):
-    """Test discovery detecting disabled api."""
-
-    service_info = zeroconf.ZeroconfServiceInfo(
-        host="192.168.43.183",
-        port=80,
-        hostname="p1meter-ddeeff.local.",
-        type="",
-        name="",
-        properties={
-            "api_enabled": "0",
-            "path": "/api/v1",
-            "product_name": "P1 meter",
-            "product_type": "HWE-P1",
-            "serial": "aabbccddeeff",
-        },
-    )
-
-    with patch("aiohwenergy.HomeWizardEnergy", return_value=get_mock_device()), patch(
-        "homeassistant.components.homewizard.async_setup_entry",
-        return_value=True,
-    ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_ZEROCONF},
-            data=service_info,
-        )
-
-    assert result["type"] == RESULT_TYPE_ABORT
-    assert result["reason"] == "api_not_enabled"
+@pytest.mark.parametrize(
+    "override, reason",
+    [
+        ({"api_enabled": "0"}, "api_not_enabled"),
+        ({"api_enabled": None}, "invalid_discovery_parameters"),
+        ({"path": "/api/not_v1"}, "unsupported_api_version"),
+    ],
+)
+async def test_discovery_aborts(hass, aioclient_mock, override, reason):
+    """Test discovery aborts on a disabled, incomplete or unsupported api.
 
+    An override value of None removes the property from the service info.
+    """
+    properties = {**BASE_PROPS, **override}
+    properties = {k: v for k, v in properties.items() if v is not None}
+    service_info = dataclasses.replace(BASE_SERVICE_INFO, properties=properties)
 
-async def test_discovery_missing_data_in_service_info(hass, aioclient_mock):
-    """Test discovery detecting missing discovery info."""
-
-    service_info = zeroconf.ZeroconfServiceInfo(
-        host="192.168.43.183",
-        port=80,
-        hostname="p1meter-ddeeff.local.",
-        type="",
-        name="",
-        properties={
-            # "api_enabled": "1", --> removed
-            "path": "/api/v1",
-            "product_name": "P1 meter",
-            "product_type": "HWE-P1",
-            "serial": "aabbccddeeff",
-        },
-    )
-
-    with patch("aiohwenergy.HomeWizardEnergy", return_value=get_mock_device()), patch(
-        "homeassistant.components.homewizard.async_setup_entry",
-        return_value=True,
-    ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_ZEROCONF},
-            data=service_info,
-        )
-
-    assert result["type"] == RESULT_TYPE_ABORT
-    assert result["reason"] == "invalid_discovery_parameters"
-
-
-async def test_discovery_invalid_api(hass, aioclient_mock):
-    """Test discovery detecting invalid_api."""
-
-    service_info = zeroconf.ZeroconfServiceInfo(
-        host="192.168.43.183",
-        port=80,
-        hostname="p1meter-ddeeff.local.",
-        type="",
-        name="",
-        properties={
-            "api_enabled": "1",
-            "path": "/api/not_v1",
-            "product_name": "P1 meter",
-            "product_type": "HWE-P1",
-            "serial": "aabbccddeeff",
-        },
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_ZEROCONF},
+        data=service_info,
     )
 
-    with patch("aiohwenergy.HomeWizardEnergy", return_value=get_mock_device()), patch(
-        "homeassistant.components.homewizard.async_setup_entry",
-        return_value=True,
-    ):
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_ZEROCONF},
-            data=service_info,
-        )
-
     assert result["type"] == RESULT_TYPE_ABORT
-    assert result["reason"] == "unsupported_api_version"
+    assert result["reason"] == reason
 
 
 async def test_check_disabled_api(hass, aioclient_mock):
     """Test check detecting disabled api."""
 
-    def MockInitialize():
-        raise DisabledError
-
     device = get_mock_device()
-    device.initialize.side_effect = MockInitialize
+    device.initialize.side_effect = DisabledError
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -225,11 +180,8 @@ async def test_check_disabled_api(hass, aioclient_mock):
 async def test_check_error_handling_api(hass, aioclient_mock):
     """Test check detecting error with api."""
 
-    def MockInitialize():
-        raise Exception()
-
     device = get_mock_device()
-    device.initialize.side_effect = MockInitialize
+    device.initialize.side_effect = Exception
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -1,6 +1,5 @@
 """Common libraries for test setup."""
 
-import shutil
 from unittest.mock import patch
 import uuid
 
@@ -70,9 +69,12 @@ async def auth(aiohttp_client):
 
 
 @pytest.fixture(autouse=True)
-def cleanup_media_storage(hass):
-    """Test cleanup, remove any media storage persisted during the test."""
-    tmp_path = str(uuid.uuid4())
-    with patch("homeassistant.components.nest.media_source.MEDIA_PATH", new=tmp_path):
+def cleanup_media_storage(tmp_path):
+    """Point media storage at a tmp_path so nothing persists in the config dir.
+
+    The absolute path keeps late media writes (e.g. flushed during shutdown)
+    out of the test config directory; pytest cleans up tmp_path itself.
+    """
+    path = str(tmp_path / str(uuid.uuid4()))
+    with patch("homeassistant.components.nest.media_source.MEDIA_PATH", new=path):
         yield
-        shutil.rmtree(hass.config.path(tmp_path), ignore_errors=True)
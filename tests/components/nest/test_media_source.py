@@ -7,6 +7,7 @@ as media in the media source.
 from collections.abc import Generator
 import datetime
 from http import HTTPStatus
+import os
 from unittest.mock import patch
 
 import aiohttp
@@ -1242,8 +1243,8 @@ async def test_camera_event_media_eviction(hass, auth, hass_client):
     ts = event_timestamp + datetime.timedelta(seconds=8)
     # Simulate a failure case removing the media on cache eviction
     with patch(
-        "homeassistant.components.nest.media_source.os.remove", side_effect=OSError
-    ) as mock_remove:
+        "homeassistant.components.nest.media_source.os.unlink", side_effect=OSError
+    ) as mock_unlink:
         await subscriber.async_receive_event(
             create_event_message(
                 create_battery_event_data(
@@ -1253,7 +1254,7 @@ async def test_camera_event_media_eviction(hass, auth, hass_client):
             )
         )
         await hass.async_block_till_done()
-        assert mock_remove.called
+        assert mock_unlink.called
 
     browse = await media_source.async_browse_media(
         hass, f"{const.URI_SCHEME}{DOMAIN}/{device.id}"
@@ -1270,3 +1271,66 @@ async def test_camera_event_media_eviction(hass, auth, hass_client):
         contents = await response.read()
         assert contents == f"image-bytes-{i}".encode()
         await hass.async_block_till_done()
+
+
+async def test_media_store_batch_flush(hass, auth):
+    """Test queued media writes are flushed to disk as a batch."""
+    subscriber = await async_setup_devices(
+        hass, auth, CAMERA_DEVICE_TYPE, CAMERA_TRAITS
+    )
+    store = subscriber.cache_policy.store
+
+    media = {
+        f"some-device/{i}-camera_motion.jpg": f"image-bytes-{i}".encode()
+        for i in range(3)
+    }
+    for media_key, contents in media.items():
+        await store.async_save_media(media_key, contents)
+    await hass.async_block_till_done()
+
+    # All queued writes landed on disk and remain readable
+    for media_key, contents in media.items():
+        filename = store.get_media_filename(media_key)
+        assert await hass.async_add_executor_job(os.path.exists, filename)
+        assert await store.async_load_media(media_key) == contents
+
+
+async def test_media_store_remove_pending_write(hass, auth):
+    """Test removing media while its write is still queued."""
+    subscriber = await async_setup_devices(
+        hass, auth, CAMERA_DEVICE_TYPE, CAMERA_TRAITS
+    )
+    store = subscriber.cache_policy.store
+
+    media_key = "some-device/1-camera_motion.jpg"
+    await store.async_save_media(media_key, IMAGE_BYTES_FROM_EVENT)
+    # Remove before the flush task has run; the queued write must not
+    # resurrect the file on disk
+    await store.async_remove_media(media_key)
+    await hass.async_block_till_done()
+
+    filename = store.get_media_filename(media_key)
+    assert not await hass.async_add_executor_job(os.path.exists, filename)
+    assert await store.async_load_media(media_key) is None
+
+
+async def test_media_store_closed_on_unload(hass, auth):
+    """Test unloading the config entry flushes and closes the media store."""
+    subscriber = await async_setup_devices(
+        hass, auth, CAMERA_DEVICE_TYPE, CAMERA_TRAITS
+    )
+    store = subscriber.cache_policy.store
+
+    media_key = "some-device/1-camera_motion.jpg"
+    await store.async_save_media(media_key, IMAGE_BYTES_FROM_EVENT)
+
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert len(entries) == 1
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    # The queued write was flushed before the store released its executor
+    filename = store.get_media_filename(media_key)
+    assert await hass.async_add_executor_job(os.path.exists, filename)
+    # Closing again is safe (e.g. unload after shutdown)
+    await store.async_close()